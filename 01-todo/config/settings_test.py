@@ -0,0 +1,24 @@
+"""
+Django settings used by the test suite.
+
+Imports the project settings and overrides the parts that only slow
+tests down.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+DEBUG = False
+
+# Django already backs SQLite test databases with memory; spelling it out
+# keeps that true if the project database ever moves to another engine.
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    }
+}
+
+# Fast (insecure) hashing; only ever used against throwaway test users.
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]
@@ -1,14 +1,19 @@
 from django import forms
 from .models import Todo
 
+_TITLE_WIDGET = forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'Enter title'})
+_DESCRIPTION_WIDGET = forms.Textarea(attrs={'class': 'form-control', 'rows': 3, 'placeholder': 'Enter description'})
+_DUE_DATE_WIDGET = forms.DateInput(attrs={'class': 'form-control', 'type': 'date'})
+_IS_RESOLVED_WIDGET = forms.CheckboxInput(attrs={'class': 'form-check-input'})
+
 
 class TodoForm(forms.ModelForm):
     class Meta:
         model = Todo
         fields = ['title', 'description', 'due_date', 'is_resolved']
         widgets = {
-            'title': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'Enter title'}),
-            'description': forms.Textarea(attrs={'class': 'form-control', 'rows': 3, 'placeholder': 'Enter description'}),
-            'due_date': forms.DateInput(attrs={'class': 'form-control', 'type': 'date'}),
-            'is_resolved': forms.CheckboxInput(attrs={'class': 'form-check-input'}),
+            'title': _TITLE_WIDGET,
+            'description': _DESCRIPTION_WIDGET,
+            'due_date': _DUE_DATE_WIDGET,
+            'is_resolved': _IS_RESOLVED_WIDGET,
         }
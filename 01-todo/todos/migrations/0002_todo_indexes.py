@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-14 06:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todos", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="todo",
+            index=models.Index(fields=["-created_at"], name="todo_created_at_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="todo",
+            index=models.Index(
+                fields=["is_resolved", "-created_at"], name="todo_resolved_created_idx"
+            ),
+        ),
+    ]
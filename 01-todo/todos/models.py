@@ -11,6 +11,10 @@ class Todo(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at'], name='todo_created_at_idx'),
+            models.Index(fields=['is_resolved', '-created_at'], name='todo_resolved_created_idx'),
+        ]
 
     def __str__(self):
         return self.title
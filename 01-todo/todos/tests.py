@@ -1,7 +1,11 @@
-from django.test import TestCase, Client
+from django.contrib.messages import get_messages
+from django.contrib.messages.storage.base import BaseStorage
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse, resolve
 from django.utils import timezone
 from datetime import date, timedelta
+from itertools import count
+from unittest import mock
 from .models import Todo
 from .forms import TodoForm
 from . import views
@@ -11,9 +15,10 @@ from . import views
 class TodoModelTest(TestCase):
     """Test cases for the Todo model"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.todo_data = {
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the class"""
+        cls.todo_data = {
             'title': 'Test TODO',
             'description': 'Test description',
             'due_date': date.today() + timedelta(days=7),
@@ -51,10 +56,17 @@ class TodoModelTest(TestCase):
 
     def test_todo_ordering(self):
         """Test TODOs are ordered by newest first"""
-        todo1 = Todo.objects.create(title='First')
-        todo2 = Todo.objects.create(title='Second')
-        todo3 = Todo.objects.create(title='Third')
-        
+        # A single bulk INSERT stamps the rows back to back, so give
+        # auto_now_add strictly increasing times to keep the order stable.
+        start = timezone.now()
+        ticks = (start + timedelta(seconds=i) for i in count())
+        with mock.patch('django.utils.timezone.now', side_effect=ticks):
+            Todo.objects.bulk_create([
+                Todo(title='First'),
+                Todo(title='Second'),
+                Todo(title='Third'),
+            ])
+
         todos = Todo.objects.all()
         self.assertEqual(todos[0].title, 'Third')
         self.assertEqual(todos[1].title, 'Second')
@@ -62,15 +74,19 @@ class TodoModelTest(TestCase):
 
     def test_todo_timestamps(self):
         """Test auto-generated timestamps"""
-        todo = Todo.objects.create(title='Timestamp Test')
-        self.assertIsNotNone(todo.created_at)
-        self.assertIsNotNone(todo.updated_at)
-        
-        # Update and verify updated_at changes
-        original_updated = todo.updated_at
-        todo.title = 'Updated Title'
-        todo.save()
-        self.assertGreater(todo.updated_at, original_updated)
+        t0 = timezone.now()
+        t1 = t0 + timedelta(minutes=1)
+        # create() stamps created_at and updated_at, save() only updated_at.
+        with mock.patch('django.utils.timezone.now', side_effect=[t0, t0, t1]):
+            todo = Todo.objects.create(title='Timestamp Test')
+            self.assertEqual(todo.created_at, t0)
+            self.assertEqual(todo.updated_at, t0)
+
+            # Update and verify updated_at changes
+            todo.title = 'Updated Title'
+            todo.save()
+        self.assertEqual(todo.created_at, t0)
+        self.assertEqual(todo.updated_at, t1)
 
 
 # ==================== FORM TESTS ====================
@@ -129,13 +145,34 @@ class TodoFormTest(TestCase):
 
 
 # ==================== VIEW TESTS ====================
+class NoopMessageStorage(BaseStorage):
+    """Message storage that drops everything, for tests ignoring flashes"""
+
+    def _get(self, *args, **kwargs):
+        return [], True
+
+    def _store(self, messages, response, *args, **kwargs):
+        return []
+
+
+# The views only need sessions and messages; cookie-backed sessions avoid
+# writing a session row on every request, and flash messages are discarded
+# unless a test opts back into real storage.
+@override_settings(
+    MIDDLEWARE=[
+        'django.contrib.sessions.middleware.SessionMiddleware',
+        'django.contrib.messages.middleware.MessageMiddleware',
+    ],
+    SESSION_ENGINE='django.contrib.sessions.backends.signed_cookies',
+    MESSAGE_STORAGE='todos.tests.NoopMessageStorage',
+)
 class TodoViewTest(TestCase):
     """Test cases for TODO views"""
 
-    def setUp(self):
-        """Set up test client and sample data"""
-        self.client = Client()
-        self.todo = Todo.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up sample data once for the class"""
+        cls.todo = Todo.objects.create(
             title='Test TODO',
             description='Test description',
             due_date=date.today() + timedelta(days=7)
@@ -156,15 +193,39 @@ class TodoViewTest(TestCase):
         """Test list view displays all TODOs"""
         response = self.client.get(reverse('todo_list'))
         self.assertIn('todos', response.context)
-        self.assertEqual(len(response.context['todos']), 1)
-        self.assertEqual(response.context['todos'][0].title, 'Test TODO')
+        page_obj = response.context['page_obj']
+        self.assertEqual(len(page_obj.object_list), 1)
+        self.assertEqual(page_obj.object_list[0].title, 'Test TODO')
+
+    def test_todo_list_view_paginates(self):
+        """Test list view splits TODOs into pages"""
+        Todo.objects.bulk_create(
+            Todo(title=f'Extra {i}') for i in range(views.TODOS_PER_PAGE)
+        )
+        response = self.client.get(reverse('todo_list'))
+        self.assertEqual(len(response.context['page_obj'].object_list), views.TODOS_PER_PAGE)
+        response = self.client.get(reverse('todo_list'), {'page': 2})
+        self.assertEqual(len(response.context['page_obj'].object_list), 1)
+
+    def test_todo_list_view_reflects_edit(self):
+        """Test cached list rows are refreshed after an edit"""
+        self.client.get(reverse('todo_list'))
+        self.todo.title = 'Renamed TODO'
+        self.todo.save()
+        response = self.client.get(reverse('todo_list'))
+        self.assertContains(response, 'Renamed TODO')
 
     def test_todo_list_view_empty(self):
         """Test list view with no TODOs"""
         Todo.objects.all().delete()
         response = self.client.get(reverse('todo_list'))
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.context['todos']), 0)
+        self.assertEqual(len(response.context['page_obj'].object_list), 0)
+
+    def test_todo_list_view_rejects_post(self):
+        """Test list view only accepts safe methods"""
+        response = self.client.post(reverse('todo_list'))
+        self.assertEqual(response.status_code, 405)
 
     # Create View Tests
     def test_todo_create_view_get(self):
@@ -188,6 +249,13 @@ class TodoViewTest(TestCase):
         new_todo = Todo.objects.get(title='New TODO')
         self.assertEqual(new_todo.description, 'New description')
 
+    @override_settings(MESSAGE_STORAGE='django.contrib.messages.storage.fallback.FallbackStorage')
+    def test_todo_create_view_post_message(self):
+        """Test create view POST flashes a success message"""
+        response = self.client.post(reverse('todo_create'), {'title': 'Flash TODO'}, follow=True)
+        messages = [str(m) for m in get_messages(response.wsgi_request)]
+        self.assertEqual(messages, ['TODO created successfully!'])
+
     def test_todo_create_view_post_invalid(self):
         """Test create view POST with invalid data"""
         data = {'description': 'Missing title'}
@@ -197,6 +265,11 @@ class TodoViewTest(TestCase):
         self.assertIn('form', response.context)
         self.assertTrue(response.context['form'].errors)
 
+    def test_todo_create_view_rejects_put(self):
+        """Test create view only accepts GET and POST"""
+        response = self.client.put(reverse('todo_create'))
+        self.assertEqual(response.status_code, 405)
+
     # Edit View Tests
     def test_todo_edit_view_get(self):
         """Test edit view GET request renders form with data"""
@@ -245,11 +318,17 @@ class TodoViewTest(TestCase):
         response = self.client.get(reverse('todo_delete', args=[9999]))
         self.assertEqual(response.status_code, 404)
 
+    def test_todo_delete_view_post_not_found(self):
+        """Test delete view POST returns 404 for non-existent TODO"""
+        response = self.client.post(reverse('todo_delete', args=[9999]))
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(Todo.objects.count(), 1)
+
     # Toggle Resolved View Tests
     def test_todo_toggle_resolved_false_to_true(self):
         """Test toggling is_resolved from False to True"""
         self.assertFalse(self.todo.is_resolved)
-        response = self.client.get(reverse('todo_toggle_resolved', args=[self.todo.pk]))
+        response = self.client.post(reverse('todo_toggle_resolved', args=[self.todo.pk]))
         self.assertEqual(response.status_code, 302)
         self.todo.refresh_from_db()
         self.assertTrue(self.todo.is_resolved)
@@ -258,42 +337,42 @@ class TodoViewTest(TestCase):
         """Test toggling is_resolved from True to False"""
         self.todo.is_resolved = True
         self.todo.save()
-        response = self.client.get(reverse('todo_toggle_resolved', args=[self.todo.pk]))
+        response = self.client.post(reverse('todo_toggle_resolved', args=[self.todo.pk]))
         self.assertEqual(response.status_code, 302)
         self.todo.refresh_from_db()
         self.assertFalse(self.todo.is_resolved)
 
     def test_todo_toggle_resolved_not_found(self):
         """Test toggle view returns 404 for non-existent TODO"""
-        response = self.client.get(reverse('todo_toggle_resolved', args=[9999]))
+        response = self.client.post(reverse('todo_toggle_resolved', args=[9999]))
         self.assertEqual(response.status_code, 404)
 
+    def test_todo_toggle_resolved_rejects_get(self):
+        """Test toggle view does not change state on GET"""
+        response = self.client.get(reverse('todo_toggle_resolved', args=[self.todo.pk]))
+        self.assertEqual(response.status_code, 405)
+        self.todo.refresh_from_db()
+        self.assertFalse(self.todo.is_resolved)
+
 
 # ==================== URL TESTS ====================
-class TodoURLTest(TestCase):
+class TodoURLTest(SimpleTestCase):
     """Test cases for URL routing"""
 
-    def test_list_url_resolves(self):
-        """Test list URL resolves to correct view"""
-        url = reverse('todo_list')
-        self.assertEqual(resolve(url).func, views.todo_list)
-
-    def test_create_url_resolves(self):
-        """Test create URL resolves to correct view"""
-        url = reverse('todo_create')
-        self.assertEqual(resolve(url).func, views.todo_create)
-
-    def test_edit_url_resolves(self):
-        """Test edit URL resolves to correct view"""
-        url = reverse('todo_edit', args=[1])
-        self.assertEqual(resolve(url).func, views.todo_edit)
-
-    def test_delete_url_resolves(self):
-        """Test delete URL resolves to correct view"""
-        url = reverse('todo_delete', args=[1])
-        self.assertEqual(resolve(url).func, views.todo_delete)
-
-    def test_toggle_url_resolves(self):
-        """Test toggle URL resolves to correct view"""
-        url = reverse('todo_toggle_resolved', args=[1])
-        self.assertEqual(resolve(url).func, views.todo_toggle_resolved)
+    routes = [
+        ('todo_list', [], views.todo_list),
+        ('todo_create', [], views.todo_create),
+        ('todo_edit', [1], views.todo_edit),
+        ('todo_delete', [1], views.todo_delete),
+        ('todo_toggle_resolved', [1], views.todo_toggle_resolved),
+    ]
+
+    def test_urls_resolve(self):
+        """Test each named URL resolves to its view"""
+        for name, args, view in self.routes:
+            with self.subTest(name=name):
+                self.assertEqual(resolve(reverse(name, args=args)).func, view)
+
+    def test_list_path_matches_url(self):
+        """Test the views' redirect target is the list URL"""
+        self.assertEqual(views._LIST_PATH, reverse('todo_list'))
@@ -1,26 +1,46 @@
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, get_object_or_404
 from django.contrib import messages
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import F
+from django.http import Http404, HttpResponseRedirect
+from django.utils import timezone
+from django.views.decorators.http import require_http_methods, require_POST, require_safe
 from .models import Todo
 from .forms import TodoForm
 
+# Where todo_list is mounted; kept in sync with urls.py by TodoURLTest.
+_LIST_PATH = '/'
 
+TODOS_PER_PAGE = 50
+
+
+@require_safe
 def todo_list(request):
-    todos = Todo.objects.all()
-    return render(request, 'todos/todo_list.html', {'todos': todos})
+    todos = Todo.objects.only(
+        'id', 'title', 'description', 'due_date', 'is_resolved', 'updated_at'
+    ).order_by('-created_at')
+    page_obj = Paginator(todos, TODOS_PER_PAGE).get_page(request.GET.get('page'))
+    return render(request, 'todos/todo_list.html', {
+        'page_obj': page_obj,
+        'todos': page_obj.object_list,
+    })
 
 
+@require_http_methods(['GET', 'POST'])
 def todo_create(request):
     if request.method == 'POST':
         form = TodoForm(request.POST)
         if form.is_valid():
             form.save()
             messages.success(request, 'TODO created successfully!')
-            return redirect('todo_list')
+            return HttpResponseRedirect(_LIST_PATH)
     else:
         form = TodoForm()
     return render(request, 'todos/todo_form.html', {'form': form, 'action': 'Create'})
 
 
+@require_http_methods(['GET', 'POST'])
 def todo_edit(request, pk):
     todo = get_object_or_404(Todo, pk=pk)
     if request.method == 'POST':
@@ -28,25 +48,34 @@ def todo_edit(request, pk):
         if form.is_valid():
             form.save()
             messages.success(request, 'TODO updated successfully!')
-            return redirect('todo_list')
+            return HttpResponseRedirect(_LIST_PATH)
     else:
         form = TodoForm(instance=todo)
     return render(request, 'todos/todo_form.html', {'form': form, 'action': 'Edit'})
 
 
+@require_http_methods(['GET', 'POST'])
 def todo_delete(request, pk):
-    todo = get_object_or_404(Todo, pk=pk)
     if request.method == 'POST':
-        todo.delete()
+        deleted, _ = Todo.objects.filter(pk=pk).delete()
+        if not deleted:
+            raise Http404('No Todo matches the given query.')
         messages.success(request, 'TODO deleted successfully!')
-        return redirect('todo_list')
+        return HttpResponseRedirect(_LIST_PATH)
+    todo = get_object_or_404(Todo, pk=pk)
     return render(request, 'todos/todo_confirm_delete.html', {'todo': todo})
 
 
+@require_POST
 def todo_toggle_resolved(request, pk):
-    todo = get_object_or_404(Todo, pk=pk)
-    todo.is_resolved = not todo.is_resolved
-    todo.save()
-    status = 'resolved' if todo.is_resolved else 'unresolved'
+    todos = Todo.objects.filter(pk=pk)
+    # The UPDATE's row lock is held until commit, so the read-back sees
+    # this request's toggle rather than a concurrent one.
+    with transaction.atomic():
+        # update() bypasses auto_now, so updated_at is set explicitly.
+        if not todos.update(is_resolved=~F('is_resolved'), updated_at=timezone.now()):
+            raise Http404('No Todo matches the given query.')
+        is_resolved = todos.values_list('is_resolved', flat=True).get()
+    status = 'resolved' if is_resolved else 'unresolved'
     messages.success(request, f'TODO marked as {status}!')
-    return redirect('todo_list')
+    return HttpResponseRedirect(_LIST_PATH)